@@ -6,11 +6,45 @@ Returns: HTTP response with user data or error
 '''
 import json
 import os
+import time
 from typing import Dict, Any
-import psycopg2
-from psycopg2.extras import RealDictCursor
+
+PROFILE_COLD_START = os.environ.get('PROFILE_COLD_START') == '1'
+_cold_start: Dict[str, float] = {}
+
+def get_db():
+    '''Imports the DB driver and connects on demand, so OPTIONS never loads psycopg2'''
+    started = time.perf_counter()
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+    imported = time.perf_counter()
+    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    connected = time.perf_counter()
+    
+    if 'import' not in _cold_start:
+        _cold_start['import'] = (imported - started) * 1000
+        _cold_start['init'] = (connected - imported) * 1000
+        _cold_start['connected_at'] = connected
+    
+    return conn, conn.cursor(cursor_factory=RealDictCursor)
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    measuring = PROFILE_COLD_START and 'handle' not in _cold_start
+    try:
+        response = handle(event, context)
+    finally:
+        if measuring and 'connected_at' in _cold_start:
+            _cold_start['handle'] = (time.perf_counter() - _cold_start['connected_at']) * 1000
+    
+    if measuring and 'handle' in _cold_start:
+        timing = {phase: round(_cold_start[phase], 1) for phase in ('import', 'init', 'handle')}
+        print(json.dumps({'cold_start_ms': timing}))
+        response['headers']['Server-Timing'] = ', '.join(f"{phase};dur={dur}" for phase, dur in timing.items())
+        response['headers']['Timing-Allow-Origin'] = '*'
+    
+    return response
+
+def handle(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
     if method == 'OPTIONS':
@@ -25,74 +59,79 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'body': ''
         }
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
-    cur = conn.cursor(cursor_factory=RealDictCursor)
+    if method != 'POST':
+        return {
+            'statusCode': 405,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Method not allowed'})
+        }
     
-    if method == 'POST':
-        body = json.loads(event.get('body', '{}'))
-        action = body.get('action')
-        username = body.get('username', '').strip()
-        password = body.get('password', '')
-        
-        if action == 'register':
-            nickname = body.get('nickname', username)
-            cur.execute(
-                "SELECT id FROM users WHERE username = %s",
-                (username,)
-            )
-            if cur.fetchone():
-                conn.close()
-                return {
-                    'statusCode': 400,
-                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                    'body': json.dumps({'error': 'Username already exists'})
-                }
-            
-            cur.execute(
-                "INSERT INTO users (username, password, nickname) VALUES (%s, %s, %s) RETURNING id, username, nickname, avatar_url",
-                (username, password, nickname)
-            )
-            user = cur.fetchone()
-            conn.commit()
+    body = json.loads(event.get('body', '{}'))
+    action = body.get('action')
+    username = body.get('username', '').strip()
+    password = body.get('password', '')
+    
+    conn, cur = get_db()
+    
+    if action == 'register':
+        nickname = body.get('nickname', username)
+        cur.execute(
+            "SELECT id FROM users WHERE username = %s",
+            (username,)
+        )
+        if cur.fetchone():
             conn.close()
-            
             return {
-                'statusCode': 200,
+                'statusCode': 400,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps(dict(user))
+                'body': json.dumps({'error': 'Username already exists'})
             }
         
-        elif action == 'login':
-            cur.execute(
-                "SELECT id, username, nickname, avatar_url FROM users WHERE username = %s AND password = %s",
-                (username, password)
-            )
-            user = cur.fetchone()
-            
-            if not user:
-                conn.close()
-                return {
-                    'statusCode': 401,
-                    'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                    'body': json.dumps({'error': 'Invalid credentials'})
-                }
-            
-            cur.execute(
-                "UPDATE users SET is_online = true WHERE id = %s",
-                (user['id'],)
-            )
-            conn.commit()
+        cur.execute(
+            "INSERT INTO users (username, password, nickname) VALUES (%s, %s, %s) RETURNING id, username, nickname, avatar_url",
+            (username, password, nickname)
+        )
+        user = cur.fetchone()
+        conn.commit()
+        conn.close()
+        
+        return {
+            'statusCode': 200,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps(dict(user))
+        }
+    
+    elif action == 'login':
+        cur.execute(
+            "SELECT id, username, nickname, avatar_url FROM users WHERE username = %s AND password = %s",
+            (username, password)
+        )
+        user = cur.fetchone()
+        
+        if not user:
             conn.close()
-            
             return {
-                'statusCode': 200,
+                'statusCode': 401,
                 'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps(dict(user))
+                'body': json.dumps({'error': 'Invalid credentials'})
             }
+        
+        cur.execute(
+            "UPDATE users SET is_online = true WHERE id = %s",
+            (user['id'],)
+        )
+        conn.commit()
+        conn.close()
+        
+        return {
+            'statusCode': 200,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps(dict(user))
+        }
     
     conn.close()
     return {
-        'statusCode': 405,
+        'statusCode': 400,
         'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-        'body': json.dumps({'error': 'Method not allowed'})
+        'body': json.dumps({'error': 'Unknown action'})
     }
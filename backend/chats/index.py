@@ -6,11 +6,114 @@ Returns: HTTP response with chat data or messages
 '''
 import json
 import os
-from typing import Dict, Any
-import psycopg2
-from psycopg2.extras import RealDictCursor
+import time
+from typing import Dict, Any, List
+
+PROFILE_COLD_START = os.environ.get('PROFILE_COLD_START') == '1'
+_cold_start: Dict[str, float] = {}
+
+def get_db():
+    '''Imports the DB driver and connects on demand, so OPTIONS never loads psycopg2'''
+    started = time.perf_counter()
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+    imported = time.perf_counter()
+    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    connected = time.perf_counter()
+    
+    if 'import' not in _cold_start:
+        _cold_start['import'] = (imported - started) * 1000
+        _cold_start['init'] = (connected - imported) * 1000
+        _cold_start['connected_at'] = connected
+    
+    return conn, conn.cursor(cursor_factory=RealDictCursor)
+
+COLUMNS_TYPE = 'application/vnd.pchat.columns+json'
+MSGPACK_TYPE = 'application/msgpack'
+JSON_TYPE = 'application/json'
+SUPPORTED_TYPES = (JSON_TYPE, COLUMNS_TYPE, MSGPACK_TYPE)
+
+def negotiate(headers: Dict[str, Any]) -> str:
+    '''Picks the wire format for list responses from the Accept header, plain JSON by default'''
+    accept = headers.get('Accept') or headers.get('accept') or ''
+    best, best_q = JSON_TYPE, 0.0
+    
+    for entry in accept.split(','):
+        media_type, *params = [part.strip() for part in entry.split(';')]
+        q = 1.0
+        for param in params:
+            key, _, value = param.partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if media_type.lower() in SUPPORTED_TYPES and q > best_q:
+            best, best_q = media_type.lower(), q
+    
+    return best
+
+def epoch_ms(values: List[Any]) -> List[Any]:
+    '''Converts a column of datetimes to epoch ms; naive TIMESTAMP values are assumed to be stored in UTC'''
+    import calendar
+    return [None if value is None else calendar.timegm(value.utctimetuple()) * 1000 + value.microsecond // 1000 for value in values]
+
+def to_columns(rows: List[Dict[str, Any]], fields: List[str]) -> Dict[str, Any]:
+    '''Transposes rows into one list per field; senders are sent once and referenced by index'''
+    from datetime import datetime
+    columns = {field: [row[field] for row in rows] for field in fields}
+    for field, values in columns.items():
+        if any(isinstance(value, datetime) for value in values):
+            columns[field] = epoch_ms(values)
+    
+    payload: Dict[str, Any] = {'count': len(rows), 'columns': columns}
+    
+    if 'sender_id' in columns and 'sender_name' in columns:
+        names = dict(zip(columns['sender_id'], columns.pop('sender_name')))
+        sender_ids = list(names)
+        slot = {sender_id: i for i, sender_id in enumerate(sender_ids)}
+        columns['sender'] = [slot[sender_id] for sender_id in columns.pop('sender_id')]
+        payload['senders'] = {'id': sender_ids, 'name': [names[sender_id] for sender_id in sender_ids]}
+    
+    return payload
+
+def rows_response(rows: List[Dict[str, Any]], fields: List[str], media_type: str) -> Dict[str, Any]:
+    headers = {'Content-Type': media_type, 'Access-Control-Allow-Origin': '*', 'Vary': 'Accept'}
+    
+    if media_type == MSGPACK_TYPE:
+        import base64
+        import msgpack
+        return {
+            'statusCode': 200,
+            'headers': headers,
+            'isBase64Encoded': True,
+            'body': base64.b64encode(msgpack.packb(to_columns(rows, fields))).decode('ascii')
+        }
+    
+    if media_type == COLUMNS_TYPE:
+        body = json.dumps(to_columns(rows, fields), default=str, ensure_ascii=False, separators=(',', ':'))
+    else:
+        body = json.dumps([dict(row) for row in rows], default=str)
+    
+    return {'statusCode': 200, 'headers': headers, 'body': body}
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    measuring = PROFILE_COLD_START and 'handle' not in _cold_start
+    try:
+        response = handle(event, context)
+    finally:
+        if measuring and 'connected_at' in _cold_start:
+            _cold_start['handle'] = (time.perf_counter() - _cold_start['connected_at']) * 1000
+    
+    if measuring and 'handle' in _cold_start:
+        timing = {phase: round(_cold_start[phase], 1) for phase in ('import', 'init', 'handle')}
+        print(json.dumps({'cold_start_ms': timing}))
+        response['headers']['Server-Timing'] = ', '.join(f"{phase};dur={dur}" for phase, dur in timing.items())
+        response['headers']['Timing-Allow-Origin'] = '*'
+    
+    return response
+
+def handle(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
     if method == 'OPTIONS':
@@ -35,8 +138,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'body': json.dumps({'error': 'User ID required'})
         }
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
-    cur = conn.cursor(cursor_factory=RealDictCursor)
+    if method not in ('GET', 'POST'):
+        return {
+            'statusCode': 405,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Method not allowed'})
+        }
+    
+    conn, cur = get_db()
     
     if method == 'GET':
         query_params = event.get('queryStringParameters', {}) or {}
@@ -52,13 +161,10 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 ORDER BY m.created_at ASC
             """, (chat_id,))
             messages = cur.fetchall()
+            fields = [column[0] for column in cur.description]
             conn.close()
             
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps([dict(m) for m in messages], default=str)
-            }
+            return rows_response(messages, fields, negotiate(headers))
         else:
             cur.execute("""
                 SELECT DISTINCT c.id, 
@@ -77,13 +183,10 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 ORDER BY last_message_time DESC NULLS LAST
             """, (user_id, user_id))
             chats = cur.fetchall()
+            fields = [column[0] for column in cur.description]
             conn.close()
             
-            return {
-                'statusCode': 200,
-                'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps([dict(c) for c in chats], default=str)
-            }
+            return rows_response(chats, fields, negotiate(headers))
     
     elif method == 'POST':
         body = json.loads(event.get('body', '{}'))
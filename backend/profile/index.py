@@ -6,11 +6,45 @@ Returns: HTTP response with updated user data
 '''
 import json
 import os
+import time
 from typing import Dict, Any
-import psycopg2
-from psycopg2.extras import RealDictCursor
+
+PROFILE_COLD_START = os.environ.get('PROFILE_COLD_START') == '1'
+_cold_start: Dict[str, float] = {}
+
+def get_db():
+    '''Imports the DB driver and connects on demand, so OPTIONS never loads psycopg2'''
+    started = time.perf_counter()
+    import psycopg2
+    from psycopg2.extras import RealDictCursor
+    imported = time.perf_counter()
+    conn = psycopg2.connect(os.environ['DATABASE_URL'])
+    connected = time.perf_counter()
+    
+    if 'import' not in _cold_start:
+        _cold_start['import'] = (imported - started) * 1000
+        _cold_start['init'] = (connected - imported) * 1000
+        _cold_start['connected_at'] = connected
+    
+    return conn, conn.cursor(cursor_factory=RealDictCursor)
 
 def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    measuring = PROFILE_COLD_START and 'handle' not in _cold_start
+    try:
+        response = handle(event, context)
+    finally:
+        if measuring and 'connected_at' in _cold_start:
+            _cold_start['handle'] = (time.perf_counter() - _cold_start['connected_at']) * 1000
+    
+    if measuring and 'handle' in _cold_start:
+        timing = {phase: round(_cold_start[phase], 1) for phase in ('import', 'init', 'handle')}
+        print(json.dumps({'cold_start_ms': timing}))
+        response['headers']['Server-Timing'] = ', '.join(f"{phase};dur={dur}" for phase, dur in timing.items())
+        response['headers']['Timing-Allow-Origin'] = '*'
+    
+    return response
+
+def handle(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     method: str = event.get('httpMethod', 'GET')
     
     if method == 'OPTIONS':
@@ -35,8 +69,14 @@ def handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             'body': json.dumps({'error': 'User ID required'})
         }
     
-    conn = psycopg2.connect(os.environ['DATABASE_URL'])
-    cur = conn.cursor(cursor_factory=RealDictCursor)
+    if method not in ('GET', 'POST'):
+        return {
+            'statusCode': 405,
+            'headers': {'Content-Type': 'application/json', 'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Method not allowed'})
+        }
+    
+    conn, cur = get_db()
     
     if method == 'GET':
         cur.execute("""
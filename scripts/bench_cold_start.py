@@ -0,0 +1,115 @@
+'''
+Business: Cold-start benchmark for the backend functions
+Args: --runs N - fresh interpreters per scenario
+      --baseline REV - also measure handlers as they were at git revision REV
+Returns: table of import / first-response latency and whether psycopg2 was loaded
+
+Each sample starts a new Python process, loads backend/<name>/index.py and
+invokes handler once, so every number is a true cold start. DB scenarios run
+only when DATABASE_URL is set; they enable PROFILE_COLD_START and report the
+import/init/handle split from the Server-Timing header. Baseline revisions
+import psycopg2 at module load, so --baseline needs the function requirements
+installed locally; otherwise those rows report ModuleNotFoundError.
+'''
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, Any, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = '''
+import importlib.util, json, sys, time
+started = time.perf_counter()
+spec = importlib.util.spec_from_file_location('index', sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+loaded = time.perf_counter()
+response = module.handler(json.loads(sys.argv[2]), None)
+finished = time.perf_counter()
+print(json.dumps({
+    'import_ms': (loaded - started) * 1000,
+    'response_ms': (finished - loaded) * 1000,
+    'status': response['statusCode'],
+    'driver_loaded': 'psycopg2' in sys.modules,
+    'server_timing': response['headers'].get('Server-Timing'),
+}))
+'''
+
+PNG = 'data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=='
+
+SCENARIOS = [
+    ('auth', 'OPTIONS', {'httpMethod': 'OPTIONS'}, False),
+    ('chats', 'OPTIONS', {'httpMethod': 'OPTIONS'}, False),
+    ('profile', 'OPTIONS', {'httpMethod': 'OPTIONS'}, False),
+    ('upload', 'OPTIONS', {'httpMethod': 'OPTIONS'}, False),
+    ('upload', 'POST file', {'httpMethod': 'POST', 'body': json.dumps({'file': PNG})}, False),
+    ('chats', 'GET chats', {'httpMethod': 'GET', 'headers': {'X-User-Id': '1'}}, True),
+    ('profile', 'GET profile', {'httpMethod': 'GET', 'headers': {'X-User-Id': '1'}}, True),
+]
+
+def run_once(path: str, event: Dict[str, Any]) -> Dict[str, Any]:
+    env = dict(os.environ, PROFILE_COLD_START='1')
+    proc = subprocess.run(
+        [sys.executable, '-c', CHILD, path, json.dumps(event)],
+        capture_output=True, text=True, env=env
+    )
+    if proc.returncode != 0:
+        lines = proc.stderr.strip().splitlines()
+        return {'error': lines[-1] if lines else f'exit {proc.returncode}'}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+def handler_path(name: str, revision: Optional[str], tmp: str) -> str:
+    if not revision:
+        return os.path.join(ROOT, 'backend', name, 'index.py')
+    path = os.path.join(tmp, revision.replace('/', '_'), name, 'index.py')
+    if os.path.exists(path):
+        return path
+    source = subprocess.run(
+        ['git', 'show', f'{revision}:backend/{name}/index.py'],
+        capture_output=True, text=True, cwd=ROOT, check=True
+    ).stdout
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(source)
+    return path
+
+def measure(label: str, revision: Optional[str], runs: int, tmp: str) -> List[str]:
+    rows = []
+    for name, scenario, event, needs_db in SCENARIOS:
+        if needs_db and 'DATABASE_URL' not in os.environ:
+            continue
+        path = handler_path(name, revision, tmp)
+        samples = [run_once(path, event) for _ in range(runs)]
+        errors = [s['error'] for s in samples if 'error' in s]
+        if errors:
+            rows.append(f"{label:<10} {name:<8} {scenario:<12} failed: {errors[0]}")
+            continue
+        import_ms = statistics.median(s['import_ms'] for s in samples)
+        response_ms = statistics.median(s['response_ms'] for s in samples)
+        driver = 'yes' if any(s['driver_loaded'] for s in samples) else 'no'
+        timing = samples[-1]['server_timing'] or ''
+        rows.append(
+            f"{label:<10} {name:<8} {scenario:<12} {import_ms:>9.2f} {response_ms:>11.2f} {import_ms + response_ms:>9.2f} {driver:>7}  {timing}"
+        )
+    return rows
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure cold-start latency of backend handlers')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--baseline', help='git revision to compare against, e.g. HEAD~1')
+    args = parser.parse_args()
+
+    print(f"{'version':<10} {'function':<8} {'scenario':<12} {'import ms':>9} {'response ms':>11} {'total ms':>9} {'psycopg2':>7}  server-timing")
+    with tempfile.TemporaryDirectory() as tmp:
+        rows = measure('current', None, args.runs, tmp)
+        if args.baseline:
+            rows += measure(args.baseline, args.baseline, args.runs, tmp)
+    print('\n'.join(rows))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+'''
+Business: Wire format benchmark for chat history responses
+Args: --messages N - size of the synthetic chat
+      --senders N - distinct senders in it
+      --runs N - repetitions per measurement (median is reported)
+Returns: table of payload size, gzipped size, encode, parse and parse+rows time per format
+
+Rows are encoded through backend/chats rows_response, so the numbers match
+what the function sends. The 'rows ms' column adds what a client must do before
+rendering: for the column formats that means rebuilding per-message rows and
+resolving sender names from the senders table. MessagePack is skipped when
+msgpack is not installed.
+'''
+import argparse
+import base64
+import gzip
+import importlib.util
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Callable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HISTORY_FIELDS = ['id', 'content', 'file_url', 'is_read', 'created_at', 'is_edited', 'sender_id', 'sender_name']
+
+def load_chats():
+    spec = importlib.util.spec_from_file_location('chats_index', os.path.join(ROOT, 'backend', 'chats', 'index.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def make_history(count: int, senders: int) -> List[Dict[str, Any]]:
+    rng = random.Random(42)
+    words = ['привет', 'как', 'дела', 'ok', 'сегодня', 'встреча', 'hello', 'see', 'you', 'later']
+    started = datetime(2026, 1, 1, 9, 0, 0)
+    rows = []
+    for i in range(count):
+        sender_id = rng.randint(1, senders)
+        rows.append({
+            'id': i + 1,
+            'content': ' '.join(rng.choice(words) for _ in range(rng.randint(1, 12))),
+            'file_url': None,
+            'is_read': rng.random() < 0.9,
+            'created_at': started + timedelta(seconds=i * 37, microseconds=rng.randint(0, 999999)),
+            'is_edited': rng.random() < 0.05,
+            'sender_id': sender_id,
+            'sender_name': f'Пользователь {sender_id}',
+        })
+    return rows
+
+def rebuild_rows(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    columns = dict(payload['columns'])
+    senders = payload.get('senders')
+    if senders:
+        slots = columns.pop('sender')
+        columns['sender_id'] = [senders['id'][slot] for slot in slots]
+        columns['sender_name'] = [senders['name'][slot] for slot in slots]
+    fields = list(columns)
+    return [dict(zip(fields, values)) for values in zip(*(columns[field] for field in fields))]
+
+def median_ms(fn: Callable[[], Any], runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare chat history wire formats')
+    parser.add_argument('--messages', type=int, default=10000)
+    parser.add_argument('--senders', type=int, default=20)
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    chats = load_chats()
+    rows = make_history(args.messages, args.senders)
+
+    formats = [chats.JSON_TYPE, chats.COLUMNS_TYPE]
+    try:
+        import msgpack
+        formats.append(chats.MSGPACK_TYPE)
+    except ImportError:
+        msgpack = None
+
+    print(f"{args.messages} messages, {args.senders} senders, median of {args.runs} runs")
+    print(f"{'format':<38} {'bytes':>10} {'gzip':>9} {'encode ms':>10} {'parse ms':>9} {'rows ms':>8}")
+    for media_type in formats:
+        encode = lambda: chats.rows_response(rows, HISTORY_FIELDS, media_type)
+        response = encode()
+        if response.get('isBase64Encoded'):
+            payload = base64.b64decode(response['body'])
+            parse = lambda: msgpack.unpackb(payload)
+        else:
+            payload = response['body'].encode('utf-8')
+            parse = lambda: json.loads(payload)
+        if media_type == chats.JSON_TYPE:
+            decode = parse
+        else:
+            decode = lambda: rebuild_rows(parse())
+        print(
+            f"{media_type:<38} {len(payload):>10} {len(gzip.compress(payload)):>9} "
+            f"{median_ms(encode, args.runs):>10.2f} {median_ms(parse, args.runs):>9.2f} {median_ms(decode, args.runs):>8.2f}"
+        )
+    if msgpack is None:
+        print('msgpack not installed, MessagePack skipped')
+
+if __name__ == '__main__':
+    main()